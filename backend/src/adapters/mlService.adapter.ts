@@ -29,6 +29,7 @@ export type MlHealthResponse = {
   detectors?: Record<string, unknown>;
   capabilities?: Record<string, unknown>;
   degraded_reasons?: string[];
+  saturation?: Record<string, number>;
 };
 
 export class MlServiceAdapter {
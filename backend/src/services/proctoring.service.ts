@@ -2364,22 +2364,30 @@ export class ProctoringService {
         payloadCapabilities.deep_review_available ?? health.capabilities.deep_review_available,
       );
 
+      // The ML service reports <detector>_unavailable and _warming; drop both for detectors this
+      // deployment has switched off. Queue depth now comes in payload.saturation; older ML builds
+      // sent it as <detector>_saturated, which is back-pressure, not degradation, so drop it always.
+      const detectorEnabled: Record<string, boolean> = {
+        face_detector: enableFaceDetector,
+        audio_detector: enableAudioAnalyzer,
+        object_detector: enableObjectDetector,
+      };
+      const detectorReasonPattern = /^(face_detector|audio_detector|object_detector)_(unavailable|warming)$/;
+      const detectorWarmingPattern = /^(face_detector|audio_detector|object_detector)_warming$/;
       const degraded = Array.isArray(payload?.degraded_reasons)
         ? payload.degraded_reasons.filter((reason: unknown) => {
-            if (typeof reason !== 'string') {
-              return false;
-            }
-            if (reason === 'face_detector_unavailable' && !enableFaceDetector) {
-              return false;
-            }
-            if (reason === 'audio_detector_unavailable' && !enableAudioAnalyzer) {
+            if (typeof reason !== 'string' || reason.endsWith('_saturated')) {
               return false;
             }
-            if (reason === 'object_detector_unavailable' && !enableObjectDetector) {
+            const detectorReason = detectorReasonPattern.exec(reason);
+            if (detectorReason && !detectorEnabled[detectorReason[1]]) {
               return false;
             }
             return true;
           })
+          // A warming detector is not live yet; report it under the existing _unavailable reason
+          // so clients that already tolerate an audio-only outage handle warm-up the same way.
+          .map((reason: string) => reason.replace(detectorWarmingPattern, '$1_unavailable'))
         : [];
       if (degraded.length > 0) {
         health.degraded_reasons.push(...degraded);
@@ -1475,7 +1475,7 @@ const ProctoringMonitor: React.FC<Props> = ({
           : [];
         const isAudioOnlyDegraded =
           degradedReasons.length > 0 &&
-          degradedReasons.every((reason) => reason === 'audio_detector_unavailable');
+          degradedReasons.every((reason) => /^audio_detector_(unavailable|warming)$/.test(reason));
 
         if (health.degraded && !isAudioOnlyDegraded) {
           markDegraded();
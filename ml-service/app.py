@@ -1,13 +1,18 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartParser
 import uvicorn
-import json
-import asyncio
 import os
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Tuple, Union
+
+from batcher import ConcurrencyGate, MicroBatcher
 
 try:
     from dotenv import load_dotenv
@@ -15,10 +20,47 @@ except Exception:
     def load_dotenv(*_args, **_kwargs):
         return False
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 
-app = FastAPI(title="YoScore ML Proctoring Service")
+class FastJSONResponse(JSONResponse):
+    """
+    Serialize with orjson (numpy-aware) when available, stdlib json otherwise.
+    Analyze endpoints return it directly so FastAPI skips its jsonable_encoder pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Start every enabled detector warming at once so their import trees load in parallel
+    for detector in (face_detector, audio_analyzer, object_detector):
+        if detector is not None:
+            detector.start_warming()
+    yield
+    # Drain the batcher first: its in-flight batches still run on the face detector
+    if face_batcher is not None:
+        await face_batcher.close()
+    for detector in (face_detector, audio_analyzer, object_detector):
+        close = getattr(detector, "close", None)
+        if close is not None:
+            close()
+
+
+app = FastAPI(
+    title="YoScore ML Proctoring Service",
+    default_response_class=FastJSONResponse,
+    lifespan=_lifespan,
+)
 logger = logging.getLogger("yoscore.ml")
 logging.basicConfig(level=logging.INFO)
 
@@ -40,22 +82,81 @@ def _safe_init(name: str, factory):
         logger.warning("[ml-service] %s failed to initialize: %s", name, exc)
         return None
 
+
+class LazyDetector:
+    """
+    Build a detector on a background thread the first time it is needed.
+
+    Until construction finishes is_ready() reports False, so endpoints answer 503
+    and /health reports the detector as warming instead of startup blocking on
+    heavy imports. Everything else is delegated to the built detector.
+    """
+
+    def __init__(self, name: str, factory):
+        self.name = name
+        self._factory = factory
+        self._detector = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start_warming(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._warm, name=f"warm-{self.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _warm(self) -> None:
+        self._detector = _safe_init(self.name, self._factory)
+
+    @property
+    def warming(self) -> bool:
+        return self._detector is None and (self._thread is None or self._thread.is_alive())
+
+    def is_ready(self) -> bool:
+        detector = self._detector
+        if detector is None:
+            self.start_warming()
+            return False
+        return detector.is_ready()
+
+    def __getattr__(self, attr: str):
+        detector = self.__dict__.get("_detector")
+        if detector is None:
+            raise AttributeError(f"{self.__dict__.get('name', 'detector')} is not initialized yet")
+        return getattr(detector, attr)
+
 ENABLE_FACE_DETECTOR = os.getenv("ENABLE_FACE_DETECTOR", "true").lower() == "true"
 ENABLE_AUDIO_ANALYZER = os.getenv("ENABLE_AUDIO_ANALYZER", "false").lower() == "true"
 ENABLE_OBJECT_DETECTOR = os.getenv("ENABLE_OBJECT_DETECTOR", "false").lower() == "true"
 DEEP_REVIEW_AVAILABLE = os.getenv("ENABLE_DEEP_REVIEW", "true").lower() == "true"
+FACE_BATCH_MAX_SIZE = int(os.getenv("FACE_BATCH_MAX_SIZE", "1"))
+FACE_BATCH_MAX_WAIT_MS = float(os.getenv("FACE_BATCH_MAX_WAIT_MS", "5"))
+FACE_DETECTOR_WORKERS = int(os.getenv("FACE_DETECTOR_WORKERS", "0"))
+AUDIO_ANALYZER_WORKERS = int(os.getenv("AUDIO_ANALYZER_WORKERS", "0"))
+FACE_CONCURRENCY = int(os.getenv("FACE_CONCURRENCY", "2"))
+AUDIO_CONCURRENCY = int(os.getenv("AUDIO_CONCURRENCY", "2"))
+OBJECT_CONCURRENCY = int(os.getenv("OBJECT_CONCURRENCY", "2"))
 
 
 def _build_face_detector():
+    if FACE_DETECTOR_WORKERS > 0:
+        from worker_pool import ProcessFaceDetector
+
+        return ProcessFaceDetector(FACE_DETECTOR_WORKERS)
+
     from face_detector import FaceDetector
 
-    return FaceDetector()
+    detector = FaceDetector()
+    detector.warmup()
+    return detector
 
 
 def _build_audio_analyzer():
     from audio_analyzer import AudioAnalyzer
 
-    return AudioAnalyzer()
+    return AudioAnalyzer(AUDIO_ANALYZER_WORKERS)
 
 
 def _build_object_detector():
@@ -64,10 +165,40 @@ def _build_object_detector():
     return ObjectDetector()
 
 
-# Initialize detectors (safe, do not crash process)
-face_detector = _safe_init("face detector", _build_face_detector) if ENABLE_FACE_DETECTOR else None
-audio_analyzer = _safe_init("audio analyzer", _build_audio_analyzer) if ENABLE_AUDIO_ANALYZER else None
-object_detector = _safe_init("object detector", _build_object_detector) if ENABLE_OBJECT_DETECTOR else None
+# Initialize detectors lazily in the background (safe, do not crash process)
+face_detector = LazyDetector("face detector", _build_face_detector) if ENABLE_FACE_DETECTOR else None
+audio_analyzer = LazyDetector("audio analyzer", _build_audio_analyzer) if ENABLE_AUDIO_ANALYZER else None
+object_detector = LazyDetector("object detector", _build_object_detector) if ENABLE_OBJECT_DETECTOR else None
+
+# Cap in-flight inference per detector so bursts queue instead of oversubscribing cores
+face_gate = ConcurrencyGate(FACE_CONCURRENCY)
+audio_gate = ConcurrencyGate(AUDIO_CONCURRENCY)
+object_gate = ConcurrencyGate(OBJECT_CONCURRENCY)
+
+
+async def _analyze_face_batch(frames: List[Any]) -> List[Any]:
+    async with face_gate:
+        return await face_detector.analyze_frames_batch(frames)
+
+
+# Coalesce concurrent face frames into one executor call when batching is enabled
+face_batcher = (
+    MicroBatcher(_analyze_face_batch, FACE_BATCH_MAX_SIZE, FACE_BATCH_MAX_WAIT_MS)
+    if face_detector is not None and FACE_BATCH_MAX_SIZE > 1
+    else None
+)
+
+
+_timestamp_cache: List[Any] = [-1, ""]
+
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp at second resolution, formatted once per second"""
+    seconds = time.time_ns() // 1_000_000_000
+    if seconds != _timestamp_cache[0]:
+        _timestamp_cache[0] = seconds
+        _timestamp_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return _timestamp_cache[1]
 
 
 @app.get("/")
@@ -76,24 +207,197 @@ async def root():
         "status": "healthy",
         "service": "ML Proctoring",
         "mode": "two_phase_lite",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utc_timestamp(),
     }
 
-class AnalysisRequest(BaseModel):
-    session_id: str
-    analysis_type: str  # 'face', 'audio', 'object'
-    timestamp: str
-    metadata: Optional[Dict[str, Any]] = None
 
-class FaceAnalysisRequest(AnalysisRequest):
-    analysis_type: str = "face"
+# Keep uploads in memory instead of letting Starlette spool anything past 1MB to a temp file.
+# Older Starlette releases call the same knob max_file_size.
+UPLOAD_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+for _spool_attr in ("spool_max_size", "max_file_size"):
+    if hasattr(MultiPartParser, _spool_attr):
+        setattr(MultiPartParser, _spool_attr, UPLOAD_SPOOL_MAX_SIZE)
+        break
+
+UPLOAD_BUFFER_SIZE = 512 * 1024
+UPLOAD_BUFFER_POOL_SIZE = 32
+_upload_buffer_pool: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+
+
+def _acquire_upload_buffer() -> bytearray:
+    try:
+        return _upload_buffer_pool.get_nowait()
+    except queue.Empty:
+        return bytearray(UPLOAD_BUFFER_SIZE)
+
+
+def _release_upload_buffer(buffer: bytearray) -> None:
+    if _upload_buffer_pool.qsize() < UPLOAD_BUFFER_POOL_SIZE:
+        _upload_buffer_pool.put(buffer)
+
+
+async def _read_upload(upload: UploadFile, buffer: bytearray) -> Union[memoryview, bytes]:
+    """Read an upload into a pooled buffer, falling back to bytes when it does not fit"""
+    if upload.size is not None and upload.size < len(buffer):
+        # Small uploads are still in Starlette's in-memory spool, so a thread hop costs more than the copy.
+        size = upload.file.readinto(buffer)
+    else:
+        size = await run_in_threadpool(upload.file.readinto, buffer)
+    if size < len(buffer):
+        return memoryview(buffer)[:size]
+    return bytes(buffer) + await upload.read()
+
+
+@asynccontextmanager
+async def _pooled_upload(upload: UploadFile):
+    """
+    Upload contents backed by a pooled buffer, returned to the pool once the body is done with it.
+    A cancelled request can leave an executor thread, worker or queued micro-batch still reading
+    the view, so on cancellation the buffer is left to the garbage collector instead.
+    """
+    buffer = _acquire_upload_buffer()
+    try:
+        yield await _read_upload(upload, buffer)
+    except Exception:
+        _release_upload_buffer(buffer)
+        raise
+    _release_upload_buffer(buffer)
+
 
-class AudioAnalysisRequest(AnalysisRequest):
-    analysis_type: str = "audio"
-    duration_ms: int
+# Fully constant, so idle frames share one dict instead of building it per request. Never mutate.
+NO_FACE_VIOLATION: Dict[str, Any] = {
+    'type': 'no_face',
+    'confidence': 0.9,
+    'description': 'No face detected in frame'
+}
+
+
+def _build_face_violations(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Map face analysis results to proctoring violations"""
+    face_count = results.get('face_count', 0)
+
+    # No face detection. Gaze, eye and coverage checks need a face, so nothing else can fire.
+    if face_count == 0:
+        return [NO_FACE_VIOLATION]
+
+    violations = []
+
+    # Multiple faces detection
+    if face_count > 1:
+        violations.append({
+            'type': 'multiple_faces',
+            'confidence': results.get('confidence', 0.8),
+            'description': f'Detected {face_count} faces'
+        })
+
+    # Face direction (looking away)
+    if results.get('gaze_direction'):
+        gaze = results['gaze_direction']
+        if gaze.get('looking_away', False):
+            violations.append({
+                'type': 'looking_away',
+                'confidence': gaze.get('confidence', 0.7),
+                'description': f'User looking {gaze.get("direction", "away")}'
+            })
+
+    # Eyes closed
+    if results.get('eyes_closed', False):
+        violations.append({
+            'type': 'eyes_closed',
+            'confidence': results.get('eye_confidence', 0.8),
+            'description': 'Eyes detected as closed'
+        })
+
+    # Face coverage (mask, hand)
+    if results.get('face_coverage', 0) > 0.3:
+        violations.append({
+            'type': 'face_covered',
+            'confidence': results.get('coverage_confidence', 0.75),
+            'description': f'Face covered ({results["face_coverage"]*100:.1f}%)'
+        })
+
+    return violations
+
+
+def _build_audio_violations(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Map audio analysis results to proctoring violations"""
+    violations = []
+    has_speech = results.get('has_speech', False)
+
+    # Speech detection
+    if has_speech:
+        violations.append({
+            'type': 'speech_detected',
+            'confidence': results.get('speech_confidence', 0.85),
+            'description': f'Speech detected: "{results.get("transcript", "...")[:50]}"'
+        })
+
+        # Multiple voices
+        if results.get('voice_count', 0) > 1:
+            violations.append({
+                'type': 'multiple_voices',
+                'confidence': results.get('voice_confidence', 0.7),
+                'description': f'Detected {results["voice_count"]} distinct voices'
+            })
+
+    # Background noise level
+    if results.get('noise_level', 0) > 0.7:
+        violations.append({
+            'type': 'high_background_noise',
+            'confidence': 0.65,
+            'description': f'High background noise ({results["noise_level"]*100:.1f}%)'
+        })
+
+    # Keyword detection (cheating related). Keywords only come from a transcript of detected speech.
+    if has_speech:
+        suspicious_keywords = results.get('suspicious_keywords', [])
+        if suspicious_keywords:
+            violations.append({
+                'type': 'suspicious_conversation',
+                'confidence': 0.8,
+                'description': f'Detected suspicious keywords: {", ".join(suspicious_keywords[:3])}'
+            })
+
+    return violations
+
+
+FORBIDDEN_OBJECT_CATEGORIES = frozenset({'cell phone', 'book', 'laptop', 'monitor', 'tablet'})
+
+
+def _build_object_violations(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Map object detection results to proctoring violations"""
+    violations = []
+    forbidden_objects = []
+    max_confidence = 0.0
+
+    # Check for forbidden objects in a single pass
+    for obj in results.get('objects', ()):
+        category = obj['category']
+        if category not in FORBIDDEN_OBJECT_CATEGORIES:
+            continue
+        confidence = obj['confidence']
+        if confidence > 0.6:
+            forbidden_objects.append(category)
+            if confidence > max_confidence:
+                max_confidence = confidence
+
+    if forbidden_objects:
+        violations.append({
+            'type': 'forbidden_object',
+            'confidence': max_confidence,
+            'description': f'Detected forbidden objects: {", ".join(forbidden_objects)}'
+        })
+
+    # Screen sharing detection (multiple screens)
+    if results.get('screen_count', 0) > 1:
+        violations.append({
+            'type': 'multiple_screens',
+            'confidence': results.get('screen_confidence', 0.75),
+            'description': f'Detected {results["screen_count"]} screens'
+        })
+
+    return violations
 
-class ObjectAnalysisRequest(AnalysisRequest):
-    analysis_type: str = "object"
 
 @app.post("/api/analyze/face")
 async def analyze_face(
@@ -107,58 +411,18 @@ async def analyze_face(
         if face_detector is None or not face_detector.is_ready():
             raise HTTPException(status_code=503, detail="Face detector is unavailable")
 
-        # Read image
-        contents = await image.read()
-        
-        # Analyze face
-        results = await face_detector.analyze_frame(contents)
+        # Read and analyze image
+        async with _pooled_upload(image) as contents:
+            if face_batcher is not None:
+                results = await face_batcher.submit(contents)
+            else:
+                async with face_gate:
+                    results = await face_detector.analyze_frame(contents)
         
         # Detect violations
-        violations = []
-        
-        # Multiple faces detection
-        if results.get('face_count', 0) > 1:
-            violations.append({
-                'type': 'multiple_faces',
-                'confidence': results.get('confidence', 0.8),
-                'description': f'Detected {results["face_count"]} faces'
-            })
-        
-        # No face detection
-        elif results.get('face_count', 0) == 0:
-            violations.append({
-                'type': 'no_face',
-                'confidence': 0.9,
-                'description': 'No face detected in frame'
-            })
-        
-        # Face direction (looking away)
-        if results.get('gaze_direction'):
-            gaze = results['gaze_direction']
-            if gaze.get('looking_away', False):
-                violations.append({
-                    'type': 'looking_away',
-                    'confidence': gaze.get('confidence', 0.7),
-                    'description': f'User looking {gaze.get("direction", "away")}'
-                })
-        
-        # Eyes closed
-        if results.get('eyes_closed', False):
-            violations.append({
-                'type': 'eyes_closed',
-                'confidence': results.get('eye_confidence', 0.8),
-                'description': 'Eyes detected as closed'
-            })
-        
-        # Face coverage (mask, hand)
-        if results.get('face_coverage', 0) > 0.3:
-            violations.append({
-                'type': 'face_covered',
-                'confidence': results.get('coverage_confidence', 0.75),
-                'description': f'Face covered ({results["face_coverage"]*100:.1f}%)'
-            })
-        
-        return {
+        violations = _build_face_violations(results)
+
+        return FastJSONResponse({
             'success': True,
             'session_id': session_id,
             'timestamp': timestamp,
@@ -166,13 +430,32 @@ async def analyze_face(
             'results': results,
             'violations': violations,
             'violation_count': len(violations)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+AUDIO_UPLOAD_EXTENSIONS = frozenset({'.webm', '.wav', '.ogg', '.mp3', '.m4a', '.mp4'})
+
+
+def _sniff_audio_extension(filename: Optional[str], content_type: Optional[str]) -> str:
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension in AUDIO_UPLOAD_EXTENSIONS:
+        return extension
+
+    content_type = (content_type or '').lower()
+    if 'wav' in content_type:
+        return '.wav'
+    if 'ogg' in content_type:
+        return '.ogg'
+    if 'mpeg' in content_type or 'mp3' in content_type:
+        return '.mp3'
+    if 'mp4' in content_type or 'm4a' in content_type:
+        return '.mp4'
+    return '.webm'
+
 @app.post("/api/analyze/audio")
 async def analyze_audio(
     audio: UploadFile = File(...),
@@ -182,75 +465,22 @@ async def analyze_audio(
     analysis_type: str = Query("audio")
 ):
     """Analyze audio for speech, external help, and unusual sounds"""
-    tmp_path = None
     try:
         if audio_analyzer is None or not audio_analyzer.is_ready():
             raise HTTPException(status_code=503, detail="Audio analyzer is unavailable")
 
-        # Read audio
-        contents = await audio.read()
-        
-        # Save temporarily. Preserve upload format so decoding can choose the right backend.
-        import tempfile
-
-        extension = os.path.splitext(audio.filename or '')[1].lower()
-        content_type = (audio.content_type or '').lower()
-        if extension not in {'.webm', '.wav', '.ogg', '.mp3', '.m4a', '.mp4'}:
-            if 'wav' in content_type:
-                extension = '.wav'
-            elif 'ogg' in content_type:
-                extension = '.ogg'
-            elif 'mpeg' in content_type or 'mp3' in content_type:
-                extension = '.mp3'
-            elif 'mp4' in content_type or 'm4a' in content_type:
-                extension = '.mp4'
-            else:
-                extension = '.webm'
+        # Decode straight from memory. Preserve upload format so decoding can choose the right backend.
+        extension = _sniff_audio_extension(audio.filename, audio.content_type)
 
-        with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as tmp:
-            tmp.write(contents)
-            tmp_path = tmp.name
-        
-        # Analyze audio
-        results = await audio_analyzer.analyze_audio(tmp_path, duration_ms)
+        # Read and analyze audio
+        async with _pooled_upload(audio) as contents:
+            async with audio_gate:
+                results = await audio_analyzer.analyze_audio_bytes(contents, extension, duration_ms)
 
         # Detect violations
-        violations = []
-        
-        # Speech detection
-        if results.get('has_speech', False):
-            violations.append({
-                'type': 'speech_detected',
-                'confidence': results.get('speech_confidence', 0.85),
-                'description': f'Speech detected: "{results.get("transcript", "...")[:50]}"'
-            })
-        
-        # Multiple voices
-        if results.get('voice_count', 0) > 1:
-            violations.append({
-                'type': 'multiple_voices',
-                'confidence': results.get('voice_confidence', 0.7),
-                'description': f'Detected {results["voice_count"]} distinct voices'
-            })
-        
-        # Background noise level
-        if results.get('noise_level', 0) > 0.7:
-            violations.append({
-                'type': 'high_background_noise',
-                'confidence': 0.65,
-                'description': f'High background noise ({results["noise_level"]*100:.1f}%)'
-            })
-        
-        # Keyword detection (cheating related)
-        suspicious_keywords = results.get('suspicious_keywords', [])
-        if suspicious_keywords:
-            violations.append({
-                'type': 'suspicious_conversation',
-                'confidence': 0.8,
-                'description': f'Detected suspicious keywords: {", ".join(suspicious_keywords[:3])}'
-            })
-        
-        return {
+        violations = _build_audio_violations(results)
+
+        return FastJSONResponse({
             'success': True,
             'session_id': session_id,
             'timestamp': timestamp,
@@ -258,15 +488,12 @@ async def analyze_audio(
             'results': results,
             'violations': violations,
             'violation_count': len(violations)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if tmp_path and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
 
 @app.post("/api/analyze/object")
 async def analyze_object(
@@ -280,42 +507,15 @@ async def analyze_object(
         if object_detector is None or not object_detector.is_ready():
             raise HTTPException(status_code=503, detail="Object detector is unavailable")
 
-        # Read image
-        contents = await image.read()
-        
-        # Analyze objects
-        results = await object_detector.detect_objects(contents)
+        # Read and analyze image
+        async with _pooled_upload(image) as contents:
+            async with object_gate:
+                results = await object_detector.detect_objects(contents)
         
         # Detect violations
-        violations = []
-        forbidden_objects = []
-        
-        # Check for forbidden objects
-        forbidden_categories = ['cell phone', 'book', 'laptop', 'monitor', 'tablet']
-        
-        for obj in results.get('objects', []):
-            if obj['category'] in forbidden_categories and obj['confidence'] > 0.6:
-                forbidden_objects.append({
-                    'object': obj['category'],
-                    'confidence': obj['confidence']
-                })
-        
-        if forbidden_objects:
-            violations.append({
-                'type': 'forbidden_object',
-                'confidence': max([o['confidence'] for o in forbidden_objects]),
-                'description': f'Detected forbidden objects: {", ".join([o["object"] for o in forbidden_objects])}'
-            })
-        
-        # Screen sharing detection (multiple screens)
-        if results.get('screen_count', 0) > 1:
-            violations.append({
-                'type': 'multiple_screens',
-                'confidence': results.get('screen_confidence', 0.75),
-                'description': f'Detected {results["screen_count"]} screens'
-            })
-        
-        return {
+        violations = _build_object_violations(results)
+
+        return FastJSONResponse({
             'success': True,
             'session_id': session_id,
             'timestamp': timestamp,
@@ -323,32 +523,41 @@ async def analyze_object(
             'results': results,
             'violations': violations,
             'violation_count': len(violations)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/health")
-async def health_check():
+HEALTH_CACHE_TTL_NS = 1_000_000_000
+_health_cache: Tuple[int, Optional[Dict[str, Any]]] = (0, None)
+
+
+def _unavailable_reason(name: str, detector) -> str:
+    if getattr(detector, "warming", False):
+        return f"{name}_warming"
+    return f"{name}_unavailable"
+
+
+def _build_health_payload() -> Dict[str, Any]:
     face_live = bool(face_detector and face_detector.is_ready())
     audio_live = bool(audio_analyzer and audio_analyzer.is_ready())
     object_live = bool(object_detector and object_detector.is_ready())
     degraded_reasons = []
 
     if ENABLE_FACE_DETECTOR and not face_live:
-        degraded_reasons.append("face_detector_unavailable")
+        degraded_reasons.append(_unavailable_reason("face_detector", face_detector))
     if ENABLE_AUDIO_ANALYZER and not audio_live:
-        degraded_reasons.append("audio_detector_unavailable")
+        degraded_reasons.append(_unavailable_reason("audio_detector", audio_analyzer))
     if ENABLE_OBJECT_DETECTOR and not object_live:
-        degraded_reasons.append("object_detector_unavailable")
+        degraded_reasons.append(_unavailable_reason("object_detector", object_detector))
 
     return {
         "status": "healthy",
         "service": "ML Proctoring",
         "mode": "two_phase_lite",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utc_timestamp(),
         "detectors": {
             "face": face_live,
             "audio": audio_live,
@@ -366,11 +575,34 @@ async def health_check():
             "browser_consensus": True,
         },
         "degraded_reasons": degraded_reasons,
+        # Requests queued behind each detector's concurrency cap. Normal back-pressure, so it is
+        # reported here rather than in degraded_reasons, which clients treat as degraded analysis.
+        "saturation": {
+            "face": face_gate.waiting,
+            "audio": audio_gate.waiting,
+            "object": object_gate.waiting,
+        },
     }
 
+
+def _get_health_payload() -> Dict[str, Any]:
+    """Return the health payload, rebuilding it at most once per TTL window for probes"""
+    global _health_cache
+    now = time.monotonic_ns()
+    cached_at, payload = _health_cache
+    if payload is None or now - cached_at >= HEALTH_CACHE_TTL_NS:
+        payload = _build_health_payload()
+        _health_cache = (now, payload)
+    return payload
+
+
+@app.get("/health")
+async def health_check():
+    return _get_health_payload()
+
 @app.get("/capabilities")
 async def capabilities():
-    health = await health_check()
+    health = _get_health_payload()
     return {
         "success": True,
         "data": {
@@ -382,10 +614,14 @@ async def capabilities():
 
 if __name__ == "__main__":
     # reload=False avoids multiprocessing/WatchFiles errors on Windows (especially Python 3.14)
+    # Per-request access lines are pure overhead on the frame-analysis hot path; app logs stay at INFO.
+    # http/loop stay on "auto" so httptools/uvloop are used when installed without breaking Windows.
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=5000,
         reload=False,
-        log_level="info"
+        log_level="info",
+        access_log=False,
+        workers=int(os.getenv("ML_SERVICE_WORKERS", "1")),
     )
@@ -0,0 +1,122 @@
+"""Micro-batching and concurrency limits for detector calls."""
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent submissions into one batch call.
+
+    The first queued payload opens a short collection window; everything that
+    arrives before it closes (or until max_batch_size is hit) is handed to
+    process_batch together. Batches are dispatched as separate tasks so a slow
+    batch never blocks collection of the next one.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+    ):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # The loop only keeps weak references to tasks; hold in-flight batches until they finish
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def submit(self, payload: Any) -> Any:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            try:
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    # asyncio.timeout, not wait_for: on 3.11 wait_for returns a get() that completes
+                    # alongside a cancel and swallows it, leaving close() waiting on the collector
+                    try:
+                        async with asyncio.timeout(remaining):
+                            batch.append(await self._queue.get())
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed mid-collection: these payloads are off the queue but not yet dispatched
+                for _, future in batch:
+                    future.cancel()
+                raise
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(partial(self._dispatch_done, batch))
+
+    def _dispatch_done(self, batch: List[Tuple[Any, asyncio.Future]], task: asyncio.Task) -> None:
+        self._dispatches.discard(task)
+        if task.cancelled():
+            # Also covers a dispatch cancelled before it first ran, which never enters its body
+            for _, future in batch:
+                future.cancel()
+
+    async def close(self) -> None:
+        """Stop collecting, cancel in-flight batches and fail anything still queued"""
+        tasks = list(self._dispatches)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.process_batch([payload for payload, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class ConcurrencyGate:
+    """asyncio.Semaphore that also reports how many callers are queued behind it"""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(self.limit)
+
+    async def __aenter__(self) -> "ConcurrencyGate":
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        self._semaphore.release()
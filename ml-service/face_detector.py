@@ -1,11 +1,63 @@
 import asyncio
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
+# FaceMesh landmarks: nose tip, eye corners, chin and mouth corner for coverage; eyelids for EAR
+COVERAGE_LANDMARKS = (1, 33, 133, 362, 263, 17, 61)
+KEY_LANDMARKS = COVERAGE_LANDMARKS + (159, 145, 386, 374)
+# Indexed by looking_away * (1 + turned_right)
+GAZE_DIRECTIONS = ("center", "left", "right")
+
+# libjpeg can scale during the IDCT; large MediaPipe frames are decoded at 1/2, 1/4 or 1/8 size
+# as long as the long edge stays at or above REDUCED_DECODE_MIN_EDGE. The Haar path always
+# decodes at full size: the eye cascade has a fixed 20x20 window and misses eyes in a shrunk ROI.
+REDUCED_DECODE_MIN_EDGE = 640
+_REDUCED_COLOR = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+# SOF markers carrying the frame size (0xC4 DHT, 0xC8 JPG and 0xCC DAC share the range but are not frames)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_dimensions(data) -> Optional[Tuple[int, int]]:
+    """(height, width) from a JPEG's frame header, or None if the bytes are not a readable JPEG"""
+    size = len(data)
+    if size < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 < size:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            return (data[i + 5] << 8) | data[i + 6], (data[i + 7] << 8) | data[i + 8]
+        i += 2 + ((data[i + 2] << 8) | data[i + 3])
+    return None
+
+
+def _decode_reduction(image_bytes) -> int:
+    """Largest DCT scale-down that still leaves REDUCED_DECODE_MIN_EDGE pixels on the long edge"""
+    dimensions = _jpeg_dimensions(image_bytes)
+    if dimensions is None:
+        return 1
+    long_edge = max(dimensions)
+    for factor in (8, 4, 2):
+        if long_edge >= REDUCED_DECODE_MIN_EDGE * factor:
+            return factor
+    return 1
+
+
 def _get_mediapipe_solutions():
     backend = os.getenv("FACE_DETECTOR_BACKEND", "opencv").lower().strip()
     if backend != "mediapipe":
@@ -17,7 +69,7 @@ def _get_mediapipe_solutions():
     return getattr(mp, "solutions", None)
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceAnalysis:
     face_count: int = 0
     gaze_direction: Optional[Dict[str, Any]] = None
@@ -25,7 +77,6 @@ class FaceAnalysis:
     face_coverage: float = 0.0
     confidence: float = 0.0
     face_box: Optional[Dict[str, float]] = None
-    landmarks: Optional[List] = None
 
 
 class FaceDetector:
@@ -48,11 +99,15 @@ class FaceDetector:
             try:
                 self.mp_face_mesh = solutions.face_mesh
                 self.mp_face_detection = solutions.face_detection
+                # Face counting comes from face_detection; the mesh only needs the primary face,
+                # and every landmark read below exists in the base 468-point model (no iris refinement).
+                # Static mode: frames from different candidates interleave here, so tracking one
+                # stream's face into the next frame mostly misses and re-detects anyway.
                 self.face_mesh = self.mp_face_mesh.FaceMesh(
-                    max_num_faces=2,
-                    refine_landmarks=True,
+                    static_image_mode=True,
+                    max_num_faces=1,
+                    refine_landmarks=False,
                     min_detection_confidence=0.45,
-                    min_tracking_confidence=0.45,
                 )
                 self.face_detection = self.mp_face_detection.FaceDetection(
                     model_selection=0,
@@ -64,6 +119,13 @@ class FaceDetector:
         else:
             self._init_opencv_fallback()
 
+        # Decode + detection get their own pool rather than the loop's default executor.
+        # MediaPipe graphs are not safe to drive from two threads at once, so that mode is serial.
+        self._cv_pool = ThreadPoolExecutor(
+            max_workers=1 if self.mode == "mediapipe" else (os.cpu_count() or 1),
+            thread_name_prefix="face-cv",
+        )
+
     def _init_opencv_fallback(self):
         self.face_cascade = cv2.CascadeClassifier(
             cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
@@ -76,22 +138,58 @@ class FaceDetector:
             return self.face_mesh is not None and self.face_detection is not None
         return self.face_cascade is not None and not self.face_cascade.empty()
 
+    def warmup(self) -> None:
+        """Run one blank frame through the active backend so the first real request skips lazy init"""
+        if self.mode == "mediapipe" and self.face_detection is not None and self.face_mesh is not None:
+            self._analyze_with_mediapipe(np.zeros((240, 320, 3), dtype=np.uint8))
+        elif self.face_cascade is not None and not self.face_cascade.empty():
+            self._analyze_with_opencv(np.zeros((240, 320), dtype=np.uint8))
+
     async def analyze_frame(self, image_bytes: bytes) -> Dict[str, Any]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._analyze_frame_sync, image_bytes)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cv_pool, self._analyze_frame_sync, image_bytes)
+
+    async def analyze_frames_batch(self, frames: List[bytes]) -> List[Any]:
+        """Analyze several frames in one executor hop; failed frames yield their exception"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cv_pool, self._analyze_frames_batch_sync, frames)
+
+    def _analyze_frames_batch_sync(self, frames: List[bytes]) -> List[Any]:
+        # Serial on purpose: the caller holds one face_gate slot for the whole batch
+        results: List[Any] = []
+        for image_bytes in frames:
+            try:
+                results.append(self._analyze_frame_sync(image_bytes))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    def close(self) -> None:
+        self._cv_pool.shutdown(wait=False, cancel_futures=True)
 
     def _analyze_frame_sync(self, image_bytes: bytes) -> Dict[str, Any]:
         nparr = np.frombuffer(image_bytes, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        use_mediapipe = (
+            self.mode == "mediapipe" and self.face_detection is not None and self.face_mesh is not None
+        )
+        if use_mediapipe:
+            reduction = _decode_reduction(image_bytes)
+            flag = _REDUCED_COLOR[reduction] if reduction > 1 else cv2.IMREAD_COLOR
+        else:
+            # Haar cascades only need luminance: decode straight to gray instead of BGR + cvtColor
+            flag = cv2.IMREAD_GRAYSCALE
+        img = cv2.imdecode(nparr, flag)
         if img is None:
             return {"error": "Could not decode image", "face_count": 0, "has_face": False}
 
-        if self.mode == "mediapipe" and self.face_detection is not None and self.face_mesh is not None:
+        if use_mediapipe:
             return self._analyze_with_mediapipe(img)
         return self._analyze_with_opencv(img)
 
-    def _analyze_with_opencv(self, img: np.ndarray) -> Dict[str, Any]:
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    def _analyze_with_opencv(self, gray: np.ndarray) -> Dict[str, Any]:
+        frame_h, frame_w = gray.shape[:2]
+        # Full resolution on purpose: the frontal cascade has a fixed 24x24 window, and downscaling
+        # HD frames pushed small (far-from-camera or second) faces below it.
         faces = self.face_cascade.detectMultiScale(
             gray,
             scaleFactor=1.1,
@@ -101,16 +199,17 @@ class FaceDetector:
 
         results = FaceAnalysis(face_count=len(faces))
         if len(faces) > 0:
-            x, y, w, h = max(faces, key=lambda f: int(f[2]) * int(f[3]))
-            frame_h, frame_w = gray.shape[:2]
+            areas = faces[:, 2].astype(np.int64) * faces[:, 3]
+            # Plain ints from here on, so every derived value below is already a Python float
+            x, y, w, h = faces[int(np.argmax(areas))].tolist()
             x_center = (x + (w / 2)) / frame_w
             y_center = (y + (h / 2)) / frame_h
 
             results.face_box = {
-                "x_center": float(x_center),
-                "y_center": float(y_center),
-                "width": float(w / frame_w),
-                "height": float(h / frame_h),
+                "x_center": x_center,
+                "y_center": y_center,
+                "width": w / frame_w,
+                "height": h / frame_h,
             }
             results.confidence = 0.7
             results.gaze_direction = self._gaze_from_face_box(x_center)
@@ -133,19 +232,15 @@ class FaceDetector:
         return self._to_dict(results)
 
     def _gaze_from_face_box(self, x_center: float) -> Dict[str, Any]:
-        horizontal_offset = float(x_center - 0.5)
+        horizontal_offset = x_center - 0.5
         abs_offset = abs(horizontal_offset)
         looking_away = abs_offset > 0.23
-        direction = "center"
-        if looking_away:
-            direction = "left" if horizontal_offset < 0 else "right"
-
         confidence = min(0.95, 0.7 + (abs_offset * 1.5))
         return {
             "looking_away": looking_away,
-            "direction": direction,
+            "direction": GAZE_DIRECTIONS[looking_away * (1 + (horizontal_offset > 0))],
             "horizontal_offset": abs_offset,
-            "confidence": float(confidence),
+            "confidence": confidence,
         }
 
     def _analyze_with_mediapipe(self, img: np.ndarray) -> Dict[str, Any]:
@@ -155,91 +250,83 @@ class FaceDetector:
         face_results = self.face_detection.process(img_rgb)
         if face_results.detections:
             results.face_count = len(face_results.detections)
-            best_detection = max(face_results.detections, key=lambda d: float(d.score[0]))
+            # Protobuf float fields already come back as Python floats
+            best_detection = max(face_results.detections, key=lambda d: d.score[0])
             best_bbox = best_detection.location_data.relative_bounding_box
-            results.confidence = float(best_detection.score[0])
+            results.confidence = best_detection.score[0]
             results.face_box = {
-                "x_center": float(best_bbox.xmin + (best_bbox.width / 2)),
-                "y_center": float(best_bbox.ymin + (best_bbox.height / 2)),
-                "width": float(best_bbox.width),
-                "height": float(best_bbox.height),
+                "x_center": best_bbox.xmin + (best_bbox.width / 2),
+                "y_center": best_bbox.ymin + (best_bbox.height / 2),
+                "width": best_bbox.width,
+                "height": best_bbox.height,
             }
 
             mesh_results = self.face_mesh.process(img_rgb)
             if mesh_results.multi_face_landmarks:
                 face_landmarks = mesh_results.multi_face_landmarks[0]
-                results.gaze_direction = self._analyze_gaze_direction(face_landmarks)
-                results.eyes_closed = self._check_eyes_closed(face_landmarks)
-                results.face_coverage = self._calculate_face_coverage(face_landmarks, best_bbox)
-                results.landmarks = [(lm.x, lm.y, lm.z) for lm in face_landmarks.landmark[:10]]
+                points = self._key_points(face_landmarks)
+                results.gaze_direction = self._analyze_gaze_direction(points)
+                results.eyes_closed = self._check_eyes_closed(points)
+                results.face_coverage = self._calculate_face_coverage(points, best_bbox)
 
         return self._to_dict(results)
 
-    def _analyze_gaze_direction(self, landmarks) -> Dict[str, Any]:
-        left_eye_inner = landmarks.landmark[133]
-        left_eye_outer = landmarks.landmark[33]
-        right_eye_inner = landmarks.landmark[362]
-        right_eye_outer = landmarks.landmark[263]
-        nose_tip = landmarks.landmark[1]
-
-        left_eye_center_x = (left_eye_inner.x + left_eye_outer.x) / 2
-        right_eye_center_x = (right_eye_inner.x + right_eye_outer.x) / 2
+    def _key_points(self, landmarks) -> Dict[int, Tuple[float, float, float]]:
+        """Read the few landmarks the checks below use once, as plain tuples, instead of per-check protobuf lookups"""
+        # The checks total ~20 float ops; a Numba kernel was measured slower here because
+        # packing the points into an array costs more than the arithmetic it would compile.
+        mesh = landmarks.landmark
+        points = {}
+        for idx in KEY_LANDMARKS:
+            lm = mesh[idx]
+            points[idx] = (lm.x, lm.y, lm.z)
+        return points
+
+    def _analyze_gaze_direction(self, points) -> Dict[str, Any]:
+        left_eye_inner = points[133]
+        left_eye_outer = points[33]
+        right_eye_inner = points[362]
+        right_eye_outer = points[263]
+        nose_tip_x = points[1][0]
+
+        left_eye_center_x = (left_eye_inner[0] + left_eye_outer[0]) / 2
+        right_eye_center_x = (right_eye_inner[0] + right_eye_outer[0]) / 2
         eyes_center_x = (left_eye_center_x + right_eye_center_x) / 2
 
-        horizontal_offset = abs(eyes_center_x - nose_tip.x)
+        horizontal_offset = abs(eyes_center_x - nose_tip_x)
         looking_away = horizontal_offset > 0.23
-        direction = "center"
-        if looking_away:
-            direction = "left" if eyes_center_x < nose_tip.x else "right"
-
         confidence = min(0.9, 0.7 + (horizontal_offset * 2))
         return {
             "looking_away": looking_away,
-            "direction": direction,
-            "horizontal_offset": float(horizontal_offset),
-            "confidence": float(confidence),
+            "direction": GAZE_DIRECTIONS[looking_away * (1 + (eyes_center_x > nose_tip_x))],
+            "horizontal_offset": horizontal_offset,
+            "confidence": confidence,
         }
 
-    def _check_eyes_closed(self, landmarks) -> bool:
-        left_eye_top = landmarks.landmark[159]
-        left_eye_bottom = landmarks.landmark[145]
-        left_eye_left = landmarks.landmark[33]
-        left_eye_right = landmarks.landmark[133]
-
-        right_eye_top = landmarks.landmark[386]
-        right_eye_bottom = landmarks.landmark[374]
-        right_eye_left = landmarks.landmark[362]
-        right_eye_right = landmarks.landmark[263]
-
-        left_ear = self._calculate_ear(left_eye_top, left_eye_bottom, left_eye_left, left_eye_right)
-        right_ear = self._calculate_ear(
-            right_eye_top, right_eye_bottom, right_eye_left, right_eye_right
-        )
+    def _check_eyes_closed(self, points) -> bool:
+        left_ear = self._calculate_ear(points[159], points[145], points[33], points[133])
+        right_ear = self._calculate_ear(points[386], points[374], points[362], points[263])
         ear = (left_ear + right_ear) / 2
         return ear < 0.25
 
     def _calculate_ear(self, top, bottom, left, right):
-        vertical = self._distance(top, bottom)
-        horizontal = self._distance(left, right)
+        vertical = math.dist(top, bottom)
+        horizontal = math.dist(left, right)
         if horizontal == 0:
             return 0.0
         return vertical / horizontal
 
-    def _distance(self, point1, point2):
-        return np.sqrt(
-            (point1.x - point2.x) ** 2
-            + (point1.y - point2.y) ** 2
-            + (point1.z - point2.z) ** 2
-        )
-
-    def _calculate_face_coverage(self, landmarks, bbox) -> float:
-        key_landmarks = [1, 33, 133, 362, 263, 17, 61]
+    def _calculate_face_coverage(self, points, bbox) -> float:
+        x_min = bbox.xmin
+        y_min = bbox.ymin
+        x_max = x_min + bbox.width
+        y_max = y_min + bbox.height
         visible_count = 0
-        for idx in key_landmarks:
-            lm = landmarks.landmark[idx]
-            if bbox.xmin <= lm.x <= bbox.xmin + bbox.width and bbox.ymin <= lm.y <= bbox.ymin + bbox.height:
+        for idx in COVERAGE_LANDMARKS:
+            x, y, _ = points[idx]
+            if x_min <= x <= x_max and y_min <= y <= y_max:
                 visible_count += 1
-        coverage = 1 - (visible_count / len(key_landmarks))
+        coverage = 1 - (visible_count / len(COVERAGE_LANDMARKS))
         return max(0.0, min(1.0, coverage))
 
     def _to_dict(self, analysis: FaceAnalysis) -> Dict[str, Any]:
@@ -248,8 +335,8 @@ class FaceDetector:
             "face_box": analysis.face_box,
             "gaze_direction": analysis.gaze_direction,
             "eyes_closed": analysis.eyes_closed,
-            "face_coverage": float(analysis.face_coverage),
-            "confidence": float(analysis.confidence),
+            "face_coverage": analysis.face_coverage,
+            "confidence": analysis.confidence,
             "has_face": analysis.face_count > 0,
             "detector_mode": self.mode,
         }
@@ -1,5 +1,5 @@
 """Object detection stub for proctoring. Replace with real model when ML stack is ready."""
-from typing import Dict, Any
+from typing import Dict, Any, List
 import asyncio
 
 
@@ -11,10 +11,17 @@ class ObjectDetector:
         return self._ready
 
     async def detect_objects(self, image_contents: bytes) -> Dict[str, Any]:
+        return (await self.detect_objects_batch([image_contents]))[0]
+
+    async def detect_objects_batch(self, images: List[bytes]) -> List[Dict[str, Any]]:
+        """One result per image; a real model should run the whole list as a single batched inference"""
         await asyncio.sleep(0)
-        return {
-            "objects": [],
-            "object_count": 0,
-            "screen_count": 1,
-            "screen_confidence": 0.0,
-        }
+        return [
+            {
+                "objects": [],
+                "object_count": 0,
+                "screen_count": 1,
+                "screen_confidence": 0.0,
+            }
+            for _ in images
+        ]
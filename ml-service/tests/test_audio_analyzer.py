@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from audio_analyzer import AudioAnalyzer
+
+librosa = pytest.importorskip("librosa")
+
+SAMPLE_RATE = 16000
+
+
+def _baseline_detect_speech(y, sr, threshold=0.02):
+    """The librosa STFT implementation _detect_speech replaced, kept as the parity reference"""
+    frame_length = int(0.025 * sr)
+    hop_length = int(0.01 * sr)
+
+    energy = np.array([
+        np.sum(y[i:i + frame_length] ** 2)
+        for i in range(0, len(y) - frame_length, hop_length)
+    ])
+
+    magnitude = np.abs(librosa.stft(y, hop_length=hop_length, n_fft=frame_length * 4))
+    freq_bins = librosa.fft_frequencies(sr=sr, n_fft=frame_length * 4)
+    speech_mask = (freq_bins >= 300) & (freq_bins <= 3400)
+    speech_energy = np.mean(magnitude[speech_mask, :], axis=0)
+
+    if len(energy) > 0:
+        energy = energy / (np.max(energy) + 1e-10)
+    if len(speech_energy) > 0:
+        speech_energy = speech_energy / (np.max(speech_energy) + 1e-10)
+
+    min_length = min(len(energy), len(speech_energy))
+    speech_frames = (energy[:min_length] + speech_energy[:min_length]) / 2 > threshold
+
+    intervals = []
+    in_speech = False
+    start = 0
+    for i, is_speech in enumerate(speech_frames):
+        if is_speech:
+            if not in_speech:
+                start = i * hop_length / sr
+                in_speech = True
+        elif in_speech:
+            if (i * hop_length / sr) - start >= 0.2:
+                intervals.append((start, i * hop_length / sr))
+            in_speech = False
+    if in_speech and len(y) / sr - start >= 0.2:
+        intervals.append((start, len(y) / sr))
+    return intervals
+
+
+def _clips(count, seed, tail_burst):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        duration = rng.uniform(0.5, 3.0)
+        t = np.arange(int(SAMPLE_RATE * duration)) / SAMPLE_RATE
+        y = rng.uniform(0.001, 0.1) * rng.standard_normal(t.size)
+        if tail_burst:
+            # Loudest speech-band content in the last few frames, as in a chunk cut mid-word
+            start = duration - rng.uniform(0.005, 0.04)
+        else:
+            start = rng.uniform(0, duration)
+        end = rng.uniform(start, duration) if not tail_burst else duration
+        mask = (t >= start) & (t < end)
+        y[mask] += rng.uniform(0.005, 0.8) * np.sin(2 * np.pi * rng.uniform(300, 3400) * t[mask])
+        yield y.astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    analyzer = AudioAnalyzer()
+    yield analyzer
+    analyzer.close()
+
+
+@pytest.mark.parametrize("tail_burst", [False, True], ids=["anywhere", "tail_burst"])
+def test_detect_speech_matches_stft_baseline(analyzer, tail_burst):
+    for y in _clips(150, seed=7, tail_burst=tail_burst):
+        expected = _baseline_detect_speech(y, SAMPLE_RATE)
+        actual = analyzer._detect_speech(y, SAMPLE_RATE)
+        assert actual == expected
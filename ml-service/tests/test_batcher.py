@@ -0,0 +1,166 @@
+import asyncio
+import gc
+
+import pytest
+
+from batcher import ConcurrencyGate, MicroBatcher
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_concurrent_submissions_are_coalesced_up_to_max_batch_size():
+    batches = []
+
+    async def process(batch):
+        batches.append(list(batch))
+        return [item * 2 for item in batch]
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.close()
+        return results
+
+    assert _run(main()) == [i * 2 for i in range(10)]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+
+
+def test_per_item_exception_fails_only_that_submitter():
+    async def process(batch):
+        return [ValueError(item) if item == "bad" else item.upper() for item in batch]
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=20)
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("bad"), batcher.submit("c"), return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    first, failed, last = _run(main())
+    assert (first, last) == ("A", "C")
+    assert isinstance(failed, ValueError)
+
+
+def test_batch_exception_fails_every_submitter():
+    async def process(batch):
+        raise RuntimeError("detector down")
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+        await batcher.close()
+        return results
+
+    assert all(isinstance(result, RuntimeError) for result in _run(main()))
+
+
+def test_cancelled_submitter_does_not_break_the_rest_of_its_batch():
+    async def process(batch):
+        await asyncio.sleep(0.05)
+        return list(batch)
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=20)
+        cancelled = asyncio.create_task(batcher.submit("x"))
+        kept = asyncio.create_task(batcher.submit("y"))
+        await asyncio.sleep(0.03)
+        cancelled.cancel()
+        result = await kept
+        await batcher.close()
+        return cancelled.cancelled(), result
+
+    assert _run(main()) == (True, "y")
+
+
+def test_in_flight_batches_are_held_until_done():
+    # The loop keeps only weak references to tasks; the batcher must own its dispatch tasks
+    async def process(batch):
+        await asyncio.sleep(0.05)
+        return list(batch)
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=1)
+        pending = asyncio.gather(*(batcher.submit(i) for i in range(4)))
+        await asyncio.sleep(0.01)
+        gc.collect()
+        in_flight = len(batcher._dispatches)
+        results = await asyncio.wait_for(pending, 1)
+        await asyncio.sleep(0)
+        held_after = len(batcher._dispatches)
+        await batcher.close()
+        return results, in_flight, held_after
+
+    assert _run(main()) == ([0, 1, 2, 3], 2, 0)
+
+
+def test_close_cancels_in_flight_and_queued_submissions_then_restarts():
+    async def main():
+        release = asyncio.Event()
+        running = asyncio.Event()
+
+        async def process(batch):
+            running.set()
+            await release.wait()
+            return list(batch)
+
+        batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=1)
+        submissions = [asyncio.create_task(batcher.submit(i)) for i in range(5)]
+        await running.wait()
+        await asyncio.wait_for(batcher.close(), 1)
+        outcomes = await asyncio.wait_for(asyncio.gather(*submissions, return_exceptions=True), 1)
+
+        release.set()
+        after_close = await asyncio.wait_for(batcher.submit("again"), 1)
+        await batcher.close()
+        return outcomes, after_close
+
+    outcomes, after_close = _run(main())
+    assert all(isinstance(outcome, asyncio.CancelledError) for outcome in outcomes)
+    assert after_close == "again"
+
+
+def test_close_while_collecting_cancels_the_undispatched_batch():
+    async def process(batch):
+        return list(batch)
+
+    async def main():
+        batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=1000)
+        submissions = [asyncio.create_task(batcher.submit(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(batcher.close(), 1)
+        return await asyncio.wait_for(asyncio.gather(*submissions, return_exceptions=True), 1)
+
+    assert all(isinstance(outcome, asyncio.CancelledError) for outcome in _run(main()))
+
+
+def test_concurrency_gate_bounds_holders_and_counts_waiters():
+    async def main():
+        gate = ConcurrencyGate(2)
+        active = 0
+        peak = 0
+        waiting_seen = 0
+
+        async def hold():
+            nonlocal active, peak, waiting_seen
+            async with gate:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                waiting_seen = max(waiting_seen, gate.waiting)
+                active -= 1
+
+        await asyncio.gather(*(hold() for _ in range(6)))
+        return peak, waiting_seen, gate.waiting
+
+    peak, waiting_seen, waiting_after = _run(main())
+    assert peak == 2
+    assert waiting_seen > 0
+    assert waiting_after == 0
+
+
+@pytest.mark.parametrize("limit", [0, -3])
+def test_concurrency_gate_limit_is_at_least_one(limit):
+    assert ConcurrencyGate(limit).limit == 1
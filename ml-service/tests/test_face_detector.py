@@ -0,0 +1,74 @@
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from face_detector import FaceDetector
+
+# Grace Hopper portrait (public domain, U.S. Navy), 256 px wide
+FACE_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "face.jpg")
+FRAME_SIZES = [(640, 480), (1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+
+
+def _encode(frame: np.ndarray) -> bytes:
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    assert ok
+    return encoded.tobytes()
+
+
+def _composite(face: np.ndarray, width: int, height: int) -> np.ndarray:
+    canvas = np.full((height, width, 3), 90, np.uint8)
+    left = (width - height) // 2
+    canvas[:, left : left + height] = cv2.resize(face, (height, height))
+    return canvas
+
+
+def _paste(canvas: np.ndarray, face: np.ndarray, width: int, left: int, top: int) -> None:
+    height = round(width * face.shape[0] / face.shape[1])
+    canvas[top : top + height, left : left + width] = cv2.resize(
+        face, (width, height), interpolation=cv2.INTER_AREA
+    )
+
+
+@pytest.fixture(scope="module")
+def face() -> np.ndarray:
+    image = cv2.imread(FACE_FIXTURE)
+    assert image is not None
+    return image
+
+
+@pytest.fixture(scope="module")
+def detector():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("FACE_DETECTOR_BACKEND", "opencv")
+        detector = FaceDetector()
+    yield detector
+    detector.close()
+
+
+@pytest.mark.parametrize("width,height", FRAME_SIZES)
+def test_haar_path_decodes_at_full_resolution(detector, monkeypatch, width, height):
+    # The eye cascade has a fixed 20x20 window; a DCT-reduced decode shrinks the ROI below it
+    seen = []
+    monkeypatch.setattr(detector, "_analyze_with_opencv", lambda gray: seen.append(gray.shape) or {})
+    detector._analyze_frame_sync(_encode(np.zeros((height, width, 3), np.uint8)))
+    assert seen == [(height, width)]
+
+
+@pytest.mark.parametrize("width,height", FRAME_SIZES)
+def test_eyes_open_at_hd_frame_sizes(detector, face, width, height):
+    result = detector._analyze_frame_sync(_encode(_composite(face, width, height)))
+    assert result["has_face"]
+    assert result["eyes_closed"] is False
+
+
+@pytest.mark.parametrize("width,height", FRAME_SIZES)
+def test_small_faces_found_in_hd_frames(detector, face, width, height):
+    # A 130 px portrait holds a ~60 px face: the smallest the cascade's minSize accepts at 640x480
+    canvas = np.full((height, width, 3), 120, np.uint8)
+    _paste(canvas, face, 130, width // 8, height // 8)
+    assert detector._analyze_frame_sync(_encode(canvas))["face_count"] == 1
+
+    _paste(canvas, face, 260, width // 2, height // 8)
+    assert detector._analyze_frame_sync(_encode(canvas))["face_count"] == 2
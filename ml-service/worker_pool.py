@@ -0,0 +1,147 @@
+"""Run the face detector in worker processes, handing frames over through shared memory."""
+import asyncio
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, Optional
+
+_worker_detector = None
+
+
+def _init_worker() -> None:
+    global _worker_detector
+    import cv2
+    from face_detector import FaceDetector
+
+    # Parallelism comes from the pool itself; N processes each spawning cpu_count
+    # OpenCV threads inside detectMultiScale would oversubscribe the cores.
+    cv2.setNumThreads(1)
+    _worker_detector = FaceDetector()
+    _worker_detector.warmup()
+
+
+def _worker_ready() -> bool:
+    return _worker_detector is not None and _worker_detector.is_ready()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always tracks attached segments; the parent owns unlinking.
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _read_shared_frames(name: str, sizes: List[int]) -> List[bytes]:
+    shm = _attach(name)
+    try:
+        frames = []
+        offset = 0
+        for size in sizes:
+            frames.append(bytes(shm.buf[offset : offset + size]))
+            offset += size
+        return frames
+    finally:
+        shm.close()
+
+
+def _analyze_shared_frame(name: str, sizes: List[int]) -> Dict[str, Any]:
+    return _worker_detector._analyze_frame_sync(_read_shared_frames(name, sizes)[0])
+
+
+def _analyze_shared_frames(name: str, sizes: List[int]) -> List[Any]:
+    return _worker_detector._analyze_frames_batch_sync(_read_shared_frames(name, sizes))
+
+
+def _analyze_frame(image_bytes: bytes) -> Dict[str, Any]:
+    return _worker_detector._analyze_frame_sync(image_bytes)
+
+
+def _analyze_frames(frames: List[bytes]) -> List[Any]:
+    return _worker_detector._analyze_frames_batch_sync(frames)
+
+
+class ProcessFaceDetector:
+    """
+    Drop-in FaceDetector replacement backed by a process pool.
+
+    Frames are copied into one of a fixed set of preallocated shared-memory
+    slots and only the slot name crosses the process boundary, so large
+    frames are never pickled through the executor pipe. A micro-batch is
+    packed into one slot and analyzed serially by one worker, so a single
+    face_gate slot keeps at most one worker busy.
+    """
+
+    def __init__(self, workers: int, slot_size: int = 1024 * 1024):
+        self.slot_size = slot_size
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        self._ready = all(self._executor.submit(_worker_ready).result() for _ in range(workers))
+        self.mode = "process_pool"
+
+        self._slots: List[shared_memory.SharedMemory] = [
+            shared_memory.SharedMemory(create=True, size=slot_size) for _ in range(workers * 2)
+        ]
+        self._free_slots: Optional[asyncio.Queue] = None
+        atexit.register(self.close)
+
+    def is_ready(self) -> bool:
+        return self._ready
+
+    async def analyze_frame(self, image_bytes: bytes) -> Dict[str, Any]:
+        if len(image_bytes) > self.slot_size:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, _analyze_frame, bytes(image_bytes))
+        return await self._run_in_slot(_analyze_shared_frame, [image_bytes])
+
+    async def analyze_frames_batch(self, frames: List[bytes]) -> List[Any]:
+        """Analyze several frames in one worker submit; failed frames yield their exception"""
+        if sum(len(frame) for frame in frames) > self.slot_size:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, _analyze_frames, [bytes(frame) for frame in frames]
+            )
+        return await self._run_in_slot(_analyze_shared_frames, frames)
+
+    async def _run_in_slot(self, function: Callable[[str, List[int]], Any], frames: List[bytes]) -> Any:
+        """Pack frames back to back into a free slot and run function(slot name, sizes) in a worker"""
+        loop = asyncio.get_running_loop()
+        if self._free_slots is None:
+            self._free_slots = asyncio.Queue()
+            for slot in self._slots:
+                self._free_slots.put_nowait(slot)
+
+        slot = await self._free_slots.get()
+        try:
+            sizes = []
+            offset = 0
+            for frame in frames:
+                size = len(frame)
+                slot.buf[offset : offset + size] = frame
+                offset += size
+                sizes.append(size)
+            future = self._executor.submit(function, slot.name, sizes)
+        except BaseException:
+            self._free_slots.put_nowait(slot)
+            raise
+        # The slot goes back once the worker has finished reading it, even if this call is cancelled
+        future.add_done_callback(lambda _: self._release_slot(loop, slot))
+        return await asyncio.wrap_future(future)
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop, slot: shared_memory.SharedMemory) -> None:
+        try:
+            loop.call_soon_threadsafe(self._free_slots.put_nowait, slot)
+        except RuntimeError:
+            # Loop already closed at shutdown; close() unlinks every slot anyway
+            pass
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for slot in self._slots:
+            try:
+                slot.close()
+                slot.unlink()
+            except FileNotFoundError:
+                pass
+        self._slots = []